@@ -244,12 +244,9 @@ def initialize_report_engine():
         logger.info("Report Engine初始化成功")
         _setup_log_stream_forwarder()
 
-        # 检测 PDF 生成依赖（Pango）
-        try:
-            from .utils.dependency_check import log_dependency_status
-            log_dependency_status()
-        except Exception as dep_err:
-            logger.warning(f"依赖检测失败: {dep_err}")
+        # PDF 生成依赖（Pango）的检测推迟到首次导出 PDF 时执行
+        # （由 /export/pdf* 接口调用 check_pango_available），
+        # 不导出 PDF 的运行路径不再承担探测开销
 
         return True
     except Exception as e:
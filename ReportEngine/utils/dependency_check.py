@@ -2,165 +2,328 @@
 检测系统依赖工具
 用于检测 PDF 生成所需的系统依赖
 """
+import functools
+import hashlib
+import importlib.util
+import json
 import os
 import sys
 import platform
 from pathlib import Path
 from loguru import logger
-from ctypes import util as ctypes_util
 
 BOX_CONTENT_WIDTH = 62
 
+# 平台在进程生命周期内不变，导入时解析一次，
+# 避免每次探测重复触发 uname()/注册表查询
+_SYSTEM = platform.system()
+_IS_WINDOWS = _SYSTEM == "Windows"
+_IS_DARWIN = _SYSTEM == "Darwin"
+_IS_LINUX = _SYSTEM == "Linux"
+
+# 首次探测成功后缓存的 weasyprint FFI 模块引用 (ffi, pango)，
+# 避免重复调用时再次走导入机制
+_WEASYPRINT_MODS = None
+
+# 跨进程的探测结果缓存：完整探测需要导入 weasyprint 并调用 FFI，
+# 冷启动可能耗时数百毫秒，结果按环境指纹落盘复用
+_PROBE_CACHE_FILE = Path.home() / ".cache" / "BettaFish" / "pango_probe.json"
+
+# 用于计算缓存键的候选 pango 库位置（存在即取 mtime，安装/升级后键会变化）
+_CANDIDATE_LIB_PATHS = {
+    "Linux": (
+        "/usr/lib/x86_64-linux-gnu/libpango-1.0.so.0",
+        "/usr/lib/aarch64-linux-gnu/libpango-1.0.so.0",
+        "/usr/lib64/libpango-1.0.so.0",
+        "/usr/lib/libpango-1.0.so.0",
+        "/usr/local/lib/libpango-1.0.so.0",
+    ),
+    "Darwin": (
+        "/opt/homebrew/lib/libpango-1.0.0.dylib",
+        "/usr/local/lib/libpango-1.0.0.dylib",
+    ),
+    "Windows": (
+        r"C:\Program Files\GTK3-Runtime Win64\bin\pango-1.0-0.dll",
+        r"C:\Program Files (x86)\GTK3-Runtime Win32\bin\pango-1.0-0.dll",
+    ),
+}
+
+
+def _probe_cache_key():
+    """
+    计算当前环境的探测缓存键。
+
+    键包含 Python 版本、平台信息、解释器与候选 pango 库的 mtime、
+    weasyprint 的安装位置，以及探测过程实际读取的环境变量
+    （GTK 路径提示、库搜索路径等）——任一变化都会触发重新探测。
+
+    Returns:
+        str: 环境指纹的十六进制摘要
+    """
+    # 探测逻辑会读取这些环境变量，用户按失败提示设置后键必须变化
+    env_values = tuple(
+        os.environ.get(v)
+        for v in _GTK_ENV_VARS + (
+            "BETTAFISH_GTK_SEARCH_ROOTS",
+            "LD_LIBRARY_PATH",
+            "DYLD_LIBRARY_PATH",
+        )
+    )
+    # PATH 全量变化太频繁，只取探测关心的疑似 GTK/Pango 条目
+    path_hits = tuple(
+        e for e in os.environ.get("PATH", "").split(os.pathsep)
+        if "gtk" in e.lower() or "pango" in e.lower()
+    )
+
+    lib_stats = []
+    for lib in _CANDIDATE_LIB_PATHS.get(_SYSTEM, ()):
+        try:
+            lib_stats.append((lib, os.stat(lib).st_mtime_ns))
+        except OSError:
+            continue
+
+    try:
+        exe_mtime = os.stat(sys.executable).st_mtime_ns
+    except OSError:
+        exe_mtime = 0
+
+    try:
+        # find_spec 不会真正导入 weasyprint，只定位安装位置
+        spec = importlib.util.find_spec("weasyprint")
+        weasyprint_origin = spec.origin if spec else None
+    except (ImportError, ValueError):
+        weasyprint_origin = None
+
+    fingerprint = repr((
+        tuple(sys.version_info),
+        platform.platform(),
+        exe_mtime,
+        weasyprint_origin,
+        env_values,
+        path_hits,
+        tuple(sorted(lib_stats)),
+    ))
+    return hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()
+
+
+def _read_probe_cache(cache_key):
+    """读取落盘的探测结果；键不匹配或文件损坏时返回 None"""
+    try:
+        with open(_PROBE_CACHE_FILE, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("key") == cache_key:
+            return data
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def _write_probe_cache(cache_key, is_available, message, added_path):
+    """原子写入探测结果（tmp + os.replace），写入失败不影响主流程"""
+    try:
+        _PROBE_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "key": cache_key,
+            "available": is_available,
+            "message": message,
+            "added_path": added_path,
+        }
+        tmp_path = f"{_PROBE_CACHE_FILE}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False)
+        os.replace(tmp_path, _PROBE_CACHE_FILE)
+    except OSError:
+        pass
+
+
+def _reapply_added_path(added_path):
+    """缓存命中时跳过扫描，但仍需把上次找到的库路径重新加入搜索路径"""
+    if not added_path:
+        return
+    if _IS_WINDOWS:
+        try:
+            if hasattr(os, "add_dll_directory"):
+                os.add_dll_directory(added_path)
+        except Exception:
+            pass
+        current_path = os.environ.get("PATH", "")
+        if added_path not in current_path.split(";"):
+            os.environ["PATH"] = f"{added_path};{current_path}"
+    elif _IS_DARWIN:
+        # added_path 是探测时的 DYLD_LIBRARY_PATH 快照，
+        # 只把缺失的条目前置补齐，不能整体覆盖当前值
+        current = os.environ.get("DYLD_LIBRARY_PATH", "")
+        current_entries = {e for e in current.split(":") if e}
+        missing = [e for e in added_path.split(":") if e and e not in current_entries]
+        if missing:
+            os.environ["DYLD_LIBRARY_PATH"] = ":".join(missing + ([current] if current else []))
+
 
 def _box_line(text: str = "") -> str:
     """Render a single line inside the 66-char help box."""
     return f"║  {text:<{BOX_CONTENT_WIDTH}}║\n"
 
 
-def _get_platform_specific_instructions():
+# 各平台的安装说明原文，按 _SYSTEM 一次性查表并格式化为 _PLATFORM_INSTRUCTIONS
+_INSTRUCTION_LINES = {
+    "Darwin": (
+        "🍎 macOS 系统解决方案：",
+        "",
+        "步骤 1: 安装依赖（宿主机执行）",
+        "  brew install pango gdk-pixbuf libffi",
+        "",
+        "步骤 2: 设置 DYLD_LIBRARY_PATH（必做）",
+        "  Apple Silicon:",
+        " export DYLD_LIBRARY_PATH=/opt/homebrew/lib:$DYLD_LIBRARY_PATH",
+        "  Intel:",
+        " export DYLD_LIBRARY_PATH=/usr/local/lib:$DYLD_LIBRARY_PATH",
+        "",
+        "步骤 3: 永久生效（推荐）",
+        "  将 export DYLD_LIBRARY_PATH=... 追加到 ~/.zshrc",
+        "  Apple 用 /opt/homebrew/lib，Intel 用 /usr/local/lib",
+        "  执行 source ~/.zshrc 后再打开新终端",
+        "",
+        "步骤 4: 新开终端执行验证",
+        "  python -m ReportEngine.utils.dependency_check",
+        "  输出含 “✓ Pango 依赖检测通过” 即配置正确",
+    ),
+    "Linux": (
+        "🐧 Linux 系统解决方案：",
+        "",
+        "Ubuntu/Debian（宿主机执行）：",
+        "  sudo apt-get update",
+        "  sudo apt-get install -y \\",
+        "    libpango-1.0-0 libpangoft2-1.0-0 libffi-dev libcairo2",
+        "    libgdk-pixbuf-2.0-0（缺失时改为 libgdk-pixbuf2.0-0）",
+        "",
+        "CentOS/RHEL：",
+        "  sudo yum install -y pango gdk-pixbuf2 libffi-devel cairo",
+        "",
+        "Docker 部署无需额外安装，镜像已包含依赖",
+    ),
+    "Windows": (
+        "🪟 Windows 系统解决方案：",
+        "",
+        "步骤 1: 安装 GTK3 Runtime（宿主机执行）",
+        "  下载页: README 中的 GTK3 Runtime 链接（建议默认路径）",
+        "",
+        "步骤 2: 将 GTK 安装目录下的 bin 加入 PATH（需新终端）",
+        "  set PATH=C:\\Program Files\\GTK3-Runtime Win64\\bin;%PATH%",
+        "  自定义路径请替换，或设置环境变量 GTK_BIN_PATH",
+        "  可选: 永久添加 PATH 示例:",
+        "    setx PATH \"C:\\Program Files\\GTK3-Runtime Win64\\bin;%PATH%\"",
+        "",
+        "步骤 3: 验证（新终端执行）",
+        "  python -m ReportEngine.utils.dependency_check",
+        "  输出含 “✓ Pango 依赖检测通过” 即配置正确",
+    ),
+}
+
+
+def _compute_platform_instructions():
     """
-    获取针对当前平台的安装说明
+    按当前平台生成带边框的安装说明块（导入时计算一次）。
 
     Returns:
         str: 平台特定的安装说明
     """
-    system = platform.system()
-
-    def _box_lines(lines):
-        """批量将多行文本包装成带边框的提示块"""
-        return "".join(_box_line(line) for line in lines)
-
-    if system == "Darwin":  # macOS
-        return _box_lines(
-            [
-                "🍎 macOS 系统解决方案：",
-                "",
-                "步骤 1: 安装依赖（宿主机执行）",
-                "  brew install pango gdk-pixbuf libffi",
-                "",
-                "步骤 2: 设置 DYLD_LIBRARY_PATH（必做）",
-                "  Apple Silicon:",
-                " export DYLD_LIBRARY_PATH=/opt/homebrew/lib:$DYLD_LIBRARY_PATH",
-                "  Intel:",
-                " export DYLD_LIBRARY_PATH=/usr/local/lib:$DYLD_LIBRARY_PATH",
-                "",
-                "步骤 3: 永久生效（推荐）",
-                "  将 export DYLD_LIBRARY_PATH=... 追加到 ~/.zshrc",
-                "  Apple 用 /opt/homebrew/lib，Intel 用 /usr/local/lib",
-                "  执行 source ~/.zshrc 后再打开新终端",
-                "",
-                "步骤 4: 新开终端执行验证",
-                "  python -m ReportEngine.utils.dependency_check",
-                "  输出含 “✓ Pango 依赖检测通过” 即配置正确",
-            ]
-        )
-    elif system == "Linux":
-        return _box_lines(
-            [
-                "🐧 Linux 系统解决方案：",
-                "",
-                "Ubuntu/Debian（宿主机执行）：",
-                "  sudo apt-get update",
-                "  sudo apt-get install -y \\",
-                "    libpango-1.0-0 libpangoft2-1.0-0 libffi-dev libcairo2",
-                "    libgdk-pixbuf-2.0-0（缺失时改为 libgdk-pixbuf2.0-0）",
-                "",
-                "CentOS/RHEL：",
-                "  sudo yum install -y pango gdk-pixbuf2 libffi-devel cairo",
-                "",
-                "Docker 部署无需额外安装，镜像已包含依赖",
-            ]
-        )
-    elif system == "Windows":
-        return _box_lines(
-            [
-                "🪟 Windows 系统解决方案：",
-                "",
-                "步骤 1: 安装 GTK3 Runtime（宿主机执行）",
-                "  下载页: README 中的 GTK3 Runtime 链接（建议默认路径）",
-                "",
-                "步骤 2: 将 GTK 安装目录下的 bin 加入 PATH（需新终端）",
-                "  set PATH=C:\\Program Files\\GTK3-Runtime Win64\\bin;%PATH%",
-                "  自定义路径请替换，或设置环境变量 GTK_BIN_PATH",
-                "  可选: 永久添加 PATH 示例:",
-                "    setx PATH \"C:\\Program Files\\GTK3-Runtime Win64\\bin;%PATH%\"",
-                "",
-                "步骤 3: 验证（新终端执行）",
-                "  python -m ReportEngine.utils.dependency_check",
-                "  输出含 “✓ Pango 依赖检测通过” 即配置正确",
-            ]
-        )
-    else:
-        return _box_lines(["请查看 PDF 导出 README 了解您系统的安装方法"])
+    lines = _INSTRUCTION_LINES.get(_SYSTEM, ("请查看 PDF 导出 README 了解您系统的安装方法",))
+    return "".join(_box_line(line) for line in lines)
+
+
+_PLATFORM_INSTRUCTIONS = _compute_platform_instructions()
+
+
+def _dir_has_pango_dll(path):
+    """
+    判断目录下是否存在 pango DLL。
+
+    先用单次 isfile 命中标准文件名，未命中再用一次 scandir 按
+    前缀/后缀匹配变体命名，不使用 glob（glob 会枚举整个目录并构建
+    Path 对象）。
 
+    Returns:
+        bool: 目录中是否找到 pango DLL
+    """
+    if os.path.isfile(os.path.join(path, "pango-1.0-0.dll")):
+        return True
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                name = entry.name.lower()
+                if name.startswith("pango") and name.endswith(".dll"):
+                    return True
+    except OSError:
+        pass
+    return False
 
+
+@functools.lru_cache(maxsize=None)
 def _ensure_windows_gtk_paths():
     """
     为 Windows 自动补充 GTK/Pango 运行时搜索路径，解决 DLL 未找到问题。
 
+    结果缓存在进程内（lru_cache），重复调用不会再次扫描磁盘。
+    非默认盘符的安装位置可通过环境变量 BETTAFISH_GTK_SEARCH_ROOTS
+    （os.pathsep 分隔的根目录列表）加入扫描。
+
     Returns:
         str | None: 成功添加的路径（没有命中则为 None）
     """
-    if platform.system() != "Windows":
+    if not _IS_WINDOWS:
         return None
 
     candidates = []
     seen = set()
 
-    def _add_candidate(path_like):
+    # PATH 只切分一次；normcase 集合用于 O(1) 的“是否已在 PATH”判断
+    path_entries = os.environ.get("PATH", "").split(os.pathsep)
+    path_entries_set = {os.path.normcase(e) for e in path_entries if e}
+
+    def _add_candidate(path_str):
         """收集可能的GTK安装路径，避免重复并兼容用户自定义目录"""
-        if not path_like:
+        if not path_str:
             return
-        p = Path(path_like)
-        # 如果传入的是安装根目录，尝试拼接 bin
-        if p.is_dir() and p.name.lower() == "bin":
-            key = str(p.resolve()).lower()
-            if key not in seen:
+        # 纯字符串 + os.path 操作，去重键用 normcase（不做 resolve，
+        # 符号链接解析在 Windows 上是额外一次系统调用且此处无必要）
+        if os.path.basename(path_str).lower() == "bin":
+            key = os.path.normcase(path_str)
+            if key not in seen and os.path.isdir(path_str):
                 seen.add(key)
-                candidates.append(p)
+                candidates.append(path_str)
         else:
-            for maybe in (p, p / "bin"):
-                key = str(maybe.resolve()).lower()
-                if maybe.exists() and key not in seen:
+            # 如果传入的是安装根目录，尝试拼接 bin
+            for maybe in (path_str, os.path.join(path_str, "bin")):
+                key = os.path.normcase(maybe)
+                if key not in seen and os.path.isdir(maybe):
                     seen.add(key)
                     candidates.append(maybe)
 
     # 用户自定义提示优先
-    for env_var in ("GTK3_RUNTIME_PATH", "GTK_RUNTIME_PATH", "GTK_BIN_PATH", "GTK_BIN_DIR", "GTK_PATH"):
+    for env_var in _GTK_ENV_VARS:
         _add_candidate(os.environ.get(env_var))
 
     program_files = os.environ.get("ProgramFiles", r"C:\\Program Files")
     program_files_x86 = os.environ.get("ProgramFiles(x86)", r"C:\\Program Files (x86)")
-    default_dirs = [
-        Path(program_files) / "GTK3-Runtime Win64",
-        Path(program_files_x86) / "GTK3-Runtime Win64",
-        Path(program_files) / "GTK3-Runtime Win32",
-        Path(program_files_x86) / "GTK3-Runtime Win32",
-        Path(program_files) / "GTK3-Runtime",
-        Path(program_files_x86) / "GTK3-Runtime",
-    ]
-
-    # 常见自定义安装位置（其他盘符 / DevelopSoftware 目录）
-    common_drives = ["C", "D", "E", "F"]
-    common_names = ["GTK3-Runtime Win64", "GTK3-Runtime Win32", "GTK3-Runtime"]
-    for drive in common_drives:
-        root = Path(f"{drive}:/")
-        for name in common_names:
-            default_dirs.append(root / name)
-            default_dirs.append(root / "DevelopSoftware" / name)
-
-    # 扫描 Program Files 下所有以 GTK 开头的目录，适配自定义安装目录名
-    for root in (program_files, program_files_x86):
-        root_path = Path(root)
-        if root_path.exists():
-            for child in root_path.glob("GTK*"):
-                default_dirs.append(child)
-
-    for d in default_dirs:
-        _add_candidate(d)
+
+    # 每个根目录只做一次 scandir，按前缀过滤 GTK* 目录，
+    # 覆盖默认安装名（GTK3-Runtime Win64 等）和自定义目录名。
+    # 额外搜索根通过 BETTAFISH_GTK_SEARCH_ROOTS 指定（os.pathsep 分隔），
+    # 取代之前对 C/D/E/F 盘符的全量探测。
+    search_roots = [program_files, program_files_x86]
+    extra_roots = os.environ.get("BETTAFISH_GTK_SEARCH_ROOTS", "")
+    search_roots.extend(r for r in extra_roots.split(os.pathsep) if r)
+
+    for root in search_roots:
+        try:
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    if entry.name.lower().startswith("gtk") and entry.is_dir(follow_symlinks=False):
+                        _add_candidate(entry.path)
+        except OSError:
+            continue
 
     # 如果用户已把自定义路径加入 PATH，也尝试识别
-    path_entries = os.environ.get("PATH", "").split(os.pathsep)
     for entry in path_entries:
         if not entry:
             continue
@@ -169,44 +332,44 @@ def _ensure_windows_gtk_paths():
             _add_candidate(entry)
 
     for path in candidates:
-        if not path or not path.exists():
-            continue
-        if not any(path.glob("pango*-1.0-*.dll")) and not (path / "pango-1.0-0.dll").exists():
+        if not _dir_has_pango_dll(path):
             continue
 
         try:
             if hasattr(os, "add_dll_directory"):
-                os.add_dll_directory(str(path))
+                os.add_dll_directory(path)
         except Exception:
             # 如果添加失败，继续尝试 PATH 方式
             pass
 
-        current_path = os.environ.get("PATH", "")
-        if str(path) not in current_path.split(";"):
-            os.environ["PATH"] = f"{path};{current_path}"
+        if os.path.normcase(path) not in path_entries_set:
+            os.environ["PATH"] = f"{path};{os.environ.get('PATH', '')}"
 
-        return str(path)
+        return path
 
     return None
 
 
+@functools.lru_cache(maxsize=None)
 def prepare_pango_environment():
     """
     初始化运行所需的本地依赖搜索路径（当前主要针对 Windows 和 macOS）。
 
+    环境变量只需补充一次，结果缓存在进程内（lru_cache）。
+
     Returns:
         str | None: 成功添加的路径（没有命中则为 None）
     """
-    system = platform.system()
-    if system == "Windows":
+    if _IS_WINDOWS:
         return _ensure_windows_gtk_paths()
-    if system == "Darwin":
+    if _IS_DARWIN:
         # 自动补全 DYLD_LIBRARY_PATH，兼容 Apple Silicon 与 Intel
-        candidates = [Path("/opt/homebrew/lib"), Path("/usr/local/lib")]
         current = os.environ.get("DYLD_LIBRARY_PATH", "")
+        # 只切分一次，集合判断是否已存在
+        current_entries = {e for e in current.split(":") if e}
         added = []
-        for c in candidates:
-            if c.exists() and str(c) not in current.split(":"):
+        for c in _DARWIN_LIB_DIRS:
+            if c.exists() and str(c) not in current_entries:
                 added.append(str(c))
         if added:
             os.environ["DYLD_LIBRARY_PATH"] = ":".join(added + ([current] if current else []))
@@ -214,64 +377,137 @@ def prepare_pango_environment():
     return None
 
 
+# find_library 在 Linux 上会派生 ldconfig/gcc/objdump，单次即可达几十毫秒，
+# 按库名缓存结果，进程内同名查找只执行一次；
+# ctypes.util 在 POSIX 上会连带导入 subprocess/re/tempfile，
+# 延迟到首次查找时再导入，不进入非 PDF 路径的导入图
+@functools.lru_cache(maxsize=64)
+def _cached_find_library(name):
+    from ctypes import util as ctypes_util
+    return ctypes_util.find_library(name)
+
+# Linux 发行版上这些 SONAME 是稳定的，直接 dlopen 探测即可，
+# 无需 find_library（后者会派生 ldconfig/gcc/objdump 子进程）
+_LINUX_SONAMES = {
+    "pango": "libpango-1.0.so.0",
+    "gobject": "libgobject-2.0.so.0",
+    "gdk-pixbuf": "libgdk_pixbuf-2.0.so.0",
+    "cairo": "libcairo.so.2",
+}
+
+# 探测目标查找表，构建一次供每次调用引用
+_WIN_PROBE_TARGETS = (
+    ("pango", ("pango-1.0-0",)),
+    ("gobject", ("gobject-2.0-0",)),
+    ("gdk-pixbuf", ("gdk_pixbuf-2.0-0",)),
+    ("cairo", ("cairo-2",)),
+)
+_POSIX_PROBE_TARGETS = (
+    ("pango", ("pango-1.0",)),
+    ("gobject", ("gobject-2.0",)),
+    ("gdk-pixbuf", ("gdk_pixbuf-2.0",)),
+    ("cairo", ("cairo", "cairo-2")),
+)
+
+# 用户可用来指定 GTK 安装位置的环境变量（按优先级排列）
+_GTK_ENV_VARS = ("GTK3_RUNTIME_PATH", "GTK_RUNTIME_PATH", "GTK_BIN_PATH", "GTK_BIN_DIR", "GTK_PATH")
+
+# macOS Homebrew 的常见动态库目录（Apple Silicon / Intel）
+_DARWIN_LIB_DIRS = (Path("/opt/homebrew/lib"), Path("/usr/local/lib"))
+
+
+@functools.lru_cache(maxsize=None)
 def _probe_native_libs():
     """
     使用 ctypes 查找关键原生库，帮助定位缺失组件。
 
+    Linux 上 find_library 会派生 ldconfig/gcc 等子进程，开销大，
+    结果缓存在进程内（lru_cache），每个进程只探测一次。
+
     Returns:
-        list[str]: 未找到的库标识
+        tuple[str, ...]: 未找到的库标识
     """
-    system = platform.system()
-    targets = []
-
-    if system == "Windows":
-        targets = [
-            ("pango", ["pango-1.0-0"]),
-            ("gobject", ["gobject-2.0-0"]),
-            ("gdk-pixbuf", ["gdk_pixbuf-2.0-0"]),
-            ("cairo", ["cairo-2"]),
-        ]
-    else:
-        targets = [
-            ("pango", ["pango-1.0"]),
-            ("gobject", ["gobject-2.0"]),
-            ("gdk-pixbuf", ["gdk_pixbuf-2.0"]),
-            ("cairo", ["cairo", "cairo-2"]),
-        ]
+    if _IS_LINUX:
+        # SONAME 已知，直接 dlopen 比 find_library 快几个数量级；
+        # 不必卸载——保持加载状态反而为后续 weasyprint 的 FFI 调用预热
+        import ctypes
+
+        missing = []
+        for key, soname in _LINUX_SONAMES.items():
+            try:
+                ctypes.CDLL(soname, mode=os.RTLD_LAZY)
+            except OSError:
+                missing.append(key)
+        return tuple(missing)
+
+    targets = _WIN_PROBE_TARGETS if _IS_WINDOWS else _POSIX_PROBE_TARGETS
 
     missing = []
     for key, variants in targets:
-        found = any(ctypes_util.find_library(v) for v in variants)
-        if not found:
+        # 命中第一个变体即停，其余变体不再触发查找
+        found = next((v for v in variants if _cached_find_library(v)), None)
+        if found is None:
             missing.append(key)
-    return missing
+    # 返回不可变 tuple，避免缓存的结果被调用方意外修改
+    return tuple(missing)
 
 
+@functools.lru_cache(maxsize=None)
 def check_pango_available():
     """
     检测 Pango 库是否可用
 
+    探测涉及 weasyprint 导入与原生库查找，代价高且结果在进程内稳定，
+    因此用 lru_cache 缓存；成功结果还会落盘到
+    ~/.cache/BettaFish/pango_probe.json，环境指纹未变化的后续进程可
+    跳过整个探测流程。测试需强制重新探测时请调用
+    reset_dependency_cache()——单独的 cache_clear() 不会清理磁盘缓存
+    和各子探测函数的缓存。
+
     Returns:
         tuple: (is_available: bool, message: str)
     """
+    cache_key = _probe_cache_key()
+    cached = _read_probe_cache(cache_key)
+    if cached is not None:
+        _reapply_added_path(cached.get("added_path"))
+        return cached["available"], cached["message"]
+
+    is_available, message, added_path = _run_pango_probe()
+    # 只落盘成功结果：失败结果缓存后，用户修复环境（装库、设置
+    # GTK_BIN_PATH 等）会继续命中过期的失败信息
+    if is_available:
+        _write_probe_cache(cache_key, is_available, message, added_path)
+    return is_available, message
+
+
+def _run_pango_probe():
+    """
+    执行完整的 Pango 依赖探测（环境准备 + weasyprint 导入 + FFI 调用）。
+
+    Returns:
+        tuple: (is_available: bool, message: str, added_path: str | None)
+    """
     added_path = prepare_pango_environment()
     missing_native = _probe_native_libs()
 
     try:
-        # 尝试导入 weasyprint 并初始化 Pango
-        from weasyprint import HTML
-        from weasyprint.text.ffi import ffi, pango
+        # 只导入探测所需的 FFI 模块（完整的 weasyprint 渲染管线留给真正
+        # 导出 PDF 时再加载），且首次成功后缓存模块引用供后续调用复用
+        global _WEASYPRINT_MODS
+        if _WEASYPRINT_MODS is None:
+            from weasyprint.text.ffi import ffi, pango
+            _WEASYPRINT_MODS = (ffi, pango)
 
         # 尝试调用 Pango 函数来确认库可用
-        pango.pango_version()
+        _WEASYPRINT_MODS[1].pango_version()
 
-        return True, "✓ Pango 依赖检测通过，PDF 导出功能可用"
+        return True, "✓ Pango 依赖检测通过，PDF 导出功能可用", added_path
     except OSError as e:
         # Pango 库未安装或无法加载
         error_msg = str(e)
-        platform_instructions = _get_platform_specific_instructions()
         windows_hint = ""
-        if platform.system() == "Windows":
+        if _IS_WINDOWS:
             prefix = "已尝试自动添加 GTK 路径: "
             max_path_len = BOX_CONTENT_WIDTH - len(prefix)
             path_display = added_path or "未找到默认路径"
@@ -288,32 +524,61 @@ def check_pango_available():
             missing_note = _box_line(f"未识别到的依赖: {missing_str}")
 
         if 'gobject' in error_msg.lower() or 'pango' in error_msg.lower() or 'gdk' in error_msg.lower():
-            box_top = "╔" + "═" * 64 + "╗\n"
-            box_bottom = "╚" + "═" * 64 + "╝"
-            return False, (
-                box_top
-                + _box_line("⚠️  PDF 导出依赖缺失")
-                + _box_line()
-                + _box_line("📄 PDF 导出功能将不可用（其他功能不受影响）")
-                + _box_line()
-                + windows_hint
-                + arch_note
-                + missing_note
-                + platform_instructions
-                + _box_line()
-                + _box_line("📖 文档：static/Partial README for PDF Exporting/README.md")
-                + box_bottom
-            )
-        return False, f"⚠ PDF 依赖加载失败: {error_msg}；缺失/未识别: {', '.join(missing_native) if missing_native else '未知'}"
+            # 每行一个元素，一次 join 拼接，便于校验对齐宽度
+            parts = [
+                "╔" + "═" * 64 + "╗\n",
+                _box_line("⚠️  PDF 导出依赖缺失"),
+                _box_line(),
+                _box_line("📄 PDF 导出功能将不可用（其他功能不受影响）"),
+                _box_line(),
+                windows_hint,
+                arch_note,
+                missing_note,
+                _PLATFORM_INSTRUCTIONS,
+                _box_line(),
+                _box_line("📖 文档：static/Partial README for PDF Exporting/README.md"),
+                "╚" + "═" * 64 + "╝",
+            ]
+            return False, "".join(parts), added_path
+        return False, f"⚠ PDF 依赖加载失败: {error_msg}；缺失/未识别: {', '.join(missing_native) if missing_native else '未知'}", added_path
     except ImportError as e:
         # weasyprint 未安装
         return False, (
             "⚠ WeasyPrint 未安装\n"
             "解决方法: pip install weasyprint"
-        )
+        ), added_path
     except Exception as e:
         # 其他未知错误
-        return False, f"⚠ PDF 依赖检测失败: {e}"
+        return False, f"⚠ PDF 依赖检测失败: {e}", added_path
+
+
+def reset_dependency_cache():
+    """
+    清空全部探测缓存，强制下次调用重新走完整探测（测试/诊断用）。
+
+    同时清理进程内各级 lru_cache 与磁盘缓存文件；只调用
+    check_pango_available.cache_clear() 是不够的——磁盘缓存会立即
+    短路重探测，且子探测函数各自的缓存仍是旧值。
+    """
+    check_pango_available.cache_clear()
+    prepare_pango_environment.cache_clear()
+    _probe_native_libs.cache_clear()
+    _ensure_windows_gtk_paths.cache_clear()
+    _cached_find_library.cache_clear()
+    try:
+        os.remove(_PROBE_CACHE_FILE)
+    except OSError:
+        pass
+
+
+def pdf_supported():
+    """
+    判断 PDF 导出是否可用（轻量封装，供只关心布尔结果的调用方使用）。
+
+    Returns:
+        bool: PDF 导出依赖是否就绪
+    """
+    return check_pango_available()[0]
 
 
 def log_dependency_status():
@@ -325,9 +590,12 @@ def log_dependency_status():
     if is_available:
         logger.success(message)
     else:
-        logger.warning(message)
-        logger.info("💡 提示：PDF 导出功能需要 Pango 库支持，但不影响系统其他功能的正常使用")
-        logger.info("📚 安装说明请参考：static/Partial README for PDF Exporting/README.md")
+        # 合并为单条多行日志，每条日志都要独立走一遍 sink 格式化与写入
+        logger.warning(
+            message
+            + "\n💡 提示：PDF 导出功能需要 Pango 库支持，但不影响系统其他功能的正常使用"
+            + "\n📚 安装说明请参考：static/Partial README for PDF Exporting/README.md"
+        )
 
     return is_available
 